@@ -6,11 +6,13 @@ Collects articles from PubMed and bioRxiv APIs.
 import os
 import json
 import time
-import requests
+import sqlite3
+import asyncio
+import aiohttp
+from io import BytesIO
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
-import requests
+from lxml import etree
 from urllib.parse import quote
 import logging
 from tqdm import tqdm
@@ -19,160 +21,389 @@ from tqdm import tqdm
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Transient statuses worth retrying with exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+
+# How long cached API responses stay valid (one week)
+CACHE_TTL = 86400 * 7
+
 
 class ArticleCollector:
     """Collects scientific articles from various sources."""
-    
-    def __init__(self, output_dir: str = "data/raw"):
+
+    def __init__(self, output_dir: str = "data/raw", api_key: Optional[str] = None):
         """
         Initialize the article collector.
-        
+
         Args:
             output_dir: Directory to save collected articles
+            api_key: Optional NCBI API key (raises the rate limit from 3 to 10 req/s)
         """
         self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
-        
+
         # PubMed E-utilities base URL
         self.pubmed_base = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
-        
+
         # bioRxiv base URL
         self.biorxiv_base = "https://api.biorxiv.org/"
-        
-    def search_pubmed(self, query: str, max_results: int = 50) -> List[str]:
+
+        # NCBI allows 3 concurrent requests/second without an API key, 10 with one
+        self.api_key = api_key or os.environ.get('NCBI_API_KEY')
+        self.max_concurrency = 10 if self.api_key else 3
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        # On-disk cache so repeated runs skip the network entirely:
+        # esearch results live in a small JSON sidecar, parsed article
+        # details in a SQLite table that scales to millions of PMIDs
+        self.cache_path = os.path.join(self.output_dir, '.api_cache.json')
+        self._cache = self._load_cache()
+        self._cache_dirty = False
+
+        self.cache_db = sqlite3.connect(
+            os.path.join(self.output_dir, 'pmid_cache.db'))
+        self.cache_db.execute(
+            'CREATE TABLE IF NOT EXISTS pmids(pmid TEXT PRIMARY KEY, parsed BLOB)')
+        self.cache_db.execute('PRAGMA journal_mode=WAL')
+        self.cache_db.execute('PRAGMA synchronous=NORMAL')
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the shared rate-limit semaphore, creating it on first use.
+
+        Created lazily from inside a coroutine so the public fetch methods
+        work standalone, not only via collect_articles_async.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    def _pubmed_params(self, **params) -> Dict:
+        """Build E-utilities request parameters, adding the API key if set."""
+        if self.api_key:
+            params['api_key'] = self.api_key
+        return params
+
+    def _load_cache(self) -> Dict:
+        """Load the API response cache from disk, if present."""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _cache_get(self, key: str):
+        """Return a cached value if present and not expired."""
+        entry = self._cache.get(key)
+        if entry and time.time() - entry['ts'] < CACHE_TTL:
+            return entry['value']
+        return None
+
+    def _cache_set(self, key: str, value):
+        """Store a value in the cache (flushed later by _flush_cache)."""
+        self._cache[key] = {'ts': time.time(), 'value': value}
+        self._cache_dirty = True
+
+    def _flush_cache(self):
+        """Write the cache back to disk if anything changed."""
+        if self._cache_dirty:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+            self._cache_dirty = False
+
+    def _db_get_many(self, pmids: List[str]) -> Dict[str, Dict]:
+        """Look up parsed article details for the given PMIDs."""
+        found = {}
+        # SQLite caps bound parameters per statement, so query in slices
+        for start in range(0, len(pmids), 500):
+            chunk = pmids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.cache_db.execute(
+                f'SELECT pmid, parsed FROM pmids WHERE pmid IN ({placeholders})',
+                chunk)
+            for pmid, parsed in rows:
+                found[pmid] = json.loads(parsed)
+        return found
+
+    def _db_put(self, pmid: str, details: Dict):
+        """Store parsed article details for a PMID."""
+        self.cache_db.execute(
+            'INSERT OR REPLACE INTO pmids(pmid, parsed) VALUES (?, ?)',
+            (pmid, json.dumps(details, ensure_ascii=False)))
+
+    def _make_session(self) -> aiohttp.ClientSession:
+        """Create a client session with a pooled, keep-alive connector."""
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10,
+                                         keepalive_timeout=30)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': 'alz-rag/1.0'}
+        )
+
+    async def _get(self, session: aiohttp.ClientSession, url: str,
+                   params: Optional[Dict] = None) -> bytes:
+        """
+        GET a URL over the pooled session, retrying transient failures.
+
+        Args:
+            session: Shared aiohttp client session
+            url: URL to fetch
+            params: Optional query parameters
+
+        Returns:
+            Raw response body
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            async with session.get(url, params=params) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                return await response.read()
+
+    async def _post(self, session: aiohttp.ClientSession, url: str,
+                    data: Optional[Dict] = None) -> bytes:
+        """
+        POST to a URL over the pooled session, retrying transient failures.
+
+        Args:
+            session: Shared aiohttp client session
+            url: URL to post to
+            data: Optional form data
+
+        Returns:
+            Raw response body
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            async with session.post(url, data=data) as response:
+                if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                    await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                response.raise_for_status()
+                return await response.read()
+
+    async def search_pubmed(self, session: aiohttp.ClientSession, query: str,
+                            max_results: int = 50) -> List[str]:
         """
         Search PubMed for articles using E-utilities.
-        
+
         Args:
+            session: Shared aiohttp client session
             query: Search query
             max_results: Maximum number of results to return
-            
+
         Returns:
             List of PubMed IDs
         """
         logger.info(f"Searching PubMed for: {query}")
-        
+
+        cache_key = f"esearch:{max_results}:{query}"
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Found {len(cached)} articles in PubMed (cached)")
+            return cached
+
         # First, get the list of PMIDs
         search_url = f"{self.pubmed_base}esearch.fcgi"
-        params = {
-            'db': 'pubmed',
-            'term': query,
-            'retmax': max_results,
-            'retmode': 'json'
-        }
-        
+        params = self._pubmed_params(
+            db='pubmed',
+            term=query,
+            retmax=max_results,
+            retmode='json'
+        )
+
         try:
-            response = requests.get(search_url, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = json.loads(await self._get(session, search_url, params))
+
             pmids = data['esearchresult']['idlist']
-            
+
             logger.info(f"Found {len(pmids)} articles in PubMed")
+            self._cache_set(cache_key, pmids)
             return pmids
-            
+
         except Exception as e:
             logger.error(f"Error searching PubMed: {e}")
             return []
-    
-    def fetch_pubmed_details(self, pmid: str) -> Optional[Dict]:
+
+    async def fetch_pubmed_details(self, session: aiohttp.ClientSession,
+                                   pmid: str) -> Optional[Dict]:
         """
         Fetch detailed information for a PubMed article.
-        
+
         Args:
+            session: Shared aiohttp client session
             pmid: PubMed ID
-            
+
         Returns:
             Dictionary with article details
         """
+        cached = self._db_get_many([pmid])
+        if pmid in cached:
+            return cached[pmid]
+
         try:
-            # Fetch article details
+            # Fetch article details, bounded by the NCBI rate limit
             fetch_url = f"{self.pubmed_base}efetch.fcgi"
-            params = {
-                'db': 'pubmed',
-                'id': pmid,
-                'retmode': 'xml'
-            }
-            
-            response = requests.get(fetch_url, params=params)
-            response.raise_for_status()
-            
-            # Parse XML response using ElementTree
-            root = ET.fromstring(response.content)
-            
+            params = self._pubmed_params(db='pubmed', id=pmid, retmode='xml')
+
+            async with self._get_semaphore():
+                content = await self._get(session, fetch_url, params)
+
+            # Parse XML response using lxml
+            root = etree.fromstring(content)
+
             # Find the first PubmedArticle
             article = root.find('.//PubmedArticle')
             if article is None:
                 return None
-            
-            # Get title
-            title_elem = article.find('.//ArticleTitle')
-            title = title_elem.text if title_elem is not None else "No title"
-            
-            # Get abstract
-            abstract_elem = article.find('.//AbstractText')
-            abstract = abstract_elem.text if abstract_elem is not None else "No abstract"
-            
-            # Get authors
-            authors = []
-            for author in article.findall('.//Author'):
-                last_name = author.find('LastName')
-                fore_name = author.find('ForeName')
-                if last_name is not None and fore_name is not None:
-                    authors.append(f"{last_name.text} {fore_name.text}")
-            
-            # Get journal
-            journal_elem = article.find('.//Title')
-            journal = journal_elem.text if journal_elem is not None else "Unknown"
-            
-            # Get publication date
-            pub_date = "Unknown"
-            pub_date_elem = article.find('.//PubDate')
-            if pub_date_elem is not None:
-                year = pub_date_elem.find('Year')
-                month = pub_date_elem.find('Month')
-                if year is not None:
-                    pub_date = year.text
-                    if month is not None:
-                        pub_date += f" {month.text}"
-            
-            return {
-                'pmid': pmid,
-                'title': title,
-                'abstract': abstract,
-                'authors': authors,
-                'journal': journal,
-                'pub_date': pub_date,
-                'source': 'pubmed'
-            }
-            
+
+            details = self._parse_pubmed_article(article, pmid)
+            self._db_put(pmid, details)
+            self.cache_db.commit()
+            return details
+
         except Exception as e:
             logger.error(f"Error fetching PubMed details for {pmid}: {e}")
             return None
-    
-    def search_biorxiv(self, query: str, max_results: int = 30) -> List[Dict]:
+
+    async def fetch_pubmed_details_batch(self, session: aiohttp.ClientSession,
+                                         pmids: List[str],
+                                         batch_size: int = 200) -> List[Dict]:
+        """
+        Fetch details for many PubMed articles in batched efetch calls.
+
+        One XML request covers up to batch_size PMIDs, collapsing M round-trips
+        to ceil(M / batch_size).
+
+        Args:
+            session: Shared aiohttp client session
+            pmids: PubMed IDs to fetch
+            batch_size: Maximum PMIDs per efetch request
+
+        Returns:
+            List of article detail dictionaries
+        """
+        fetch_url = f"{self.pubmed_base}efetch.fcgi"
+        articles = []
+
+        # Serve whatever we already have from the cache; fetch only misses
+        cached = self._db_get_many(pmids)
+        articles.extend(cached.values())
+        misses = [pmid for pmid in pmids if pmid not in cached]
+        if cached:
+            logger.info(f"Loaded {len(cached)} articles from cache")
+
+        # Progress is per batch now that one request covers many PMIDs;
+        # hide the bar for the common single-batch case
+        batch_starts = tqdm(range(0, len(misses), batch_size),
+                            desc="PubMed batches",
+                            disable=len(misses) <= batch_size)
+        for start in batch_starts:
+            chunk = misses[start:start + batch_size]
+            # POST keeps long id lists out of the URL
+            data = self._pubmed_params(db='pubmed', id=','.join(chunk),
+                                       retmode='xml')
+
+            try:
+                async with self._get_semaphore():
+                    content = await self._post(session, fetch_url, data)
+            except Exception as e:
+                logger.error(f"Error fetching PubMed batch "
+                             f"({chunk[0]}..{chunk[-1]}): {e}")
+                continue
+
+            # Stream articles out of the response, freeing each element as we go
+            for _, elem in etree.iterparse(BytesIO(content), events=('end',),
+                                           tag='PubmedArticle'):
+                pmid = elem.findtext('.//PMID', default='')
+                details = self._parse_pubmed_article(elem, pmid)
+                self._db_put(pmid, details)
+                articles.append(details)
+                # Free the element and any preceding siblings (lxml idiom)
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+            self.cache_db.commit()
+
+        return articles
+
+    def _parse_pubmed_article(self, article: etree._Element, pmid: str) -> Dict:
+        """
+        Extract article fields from a parsed PubmedArticle element.
+
+        Args:
+            article: PubmedArticle XML element
+            pmid: PubMed ID for the article
+
+        Returns:
+            Dictionary with article details
+        """
+        # Get title
+        title_elem = article.find('.//ArticleTitle')
+        title = title_elem.text if title_elem is not None else "No title"
+
+        # Get abstract
+        abstract_elem = article.find('.//AbstractText')
+        abstract = abstract_elem.text if abstract_elem is not None else "No abstract"
+
+        # Get authors
+        authors = []
+        for author in article.findall('.//Author'):
+            last_name = author.find('LastName')
+            fore_name = author.find('ForeName')
+            if last_name is not None and fore_name is not None:
+                authors.append(f"{last_name.text} {fore_name.text}")
+
+        # Get journal
+        journal_elem = article.find('.//Title')
+        journal = journal_elem.text if journal_elem is not None else "Unknown"
+
+        # Get publication date
+        pub_date = "Unknown"
+        pub_date_elem = article.find('.//PubDate')
+        if pub_date_elem is not None:
+            year = pub_date_elem.find('Year')
+            month = pub_date_elem.find('Month')
+            if year is not None:
+                pub_date = year.text
+                if month is not None:
+                    pub_date += f" {month.text}"
+
+        return {
+            'pmid': pmid,
+            'title': title,
+            'abstract': abstract,
+            'authors': authors,
+            'journal': journal,
+            'pub_date': pub_date,
+            'source': 'pubmed'
+        }
+
+    async def search_biorxiv(self, session: aiohttp.ClientSession, query: str,
+                             max_results: int = 30) -> List[Dict]:
         """
         Search bioRxiv for preprints.
-        
+
         Args:
+            session: Shared aiohttp client session
             query: Search query
             max_results: Maximum number of results to return
-            
+
         Returns:
             List of article details
         """
         logger.info(f"Searching bioRxiv for: {query}")
-        
+
         try:
             # bioRxiv API endpoint
             search_url = f"{self.biorxiv_base}details/10.1101/{quote(query)}/"
-            
-            response = requests.get(search_url)
-            response.raise_for_status()
-            
-            data = response.json()
+
+            data = json.loads(await self._get(session, search_url))
+
             articles = []
-            
+
             if 'collection' in data:
                 for item in data['collection'][:max_results]:
                     articles.append({
@@ -184,68 +415,84 @@ class ArticleCollector:
                         'pub_date': item.get('date', ''),
                         'source': 'biorxiv'
                     })
-            
+
             logger.info(f"Found {len(articles)} articles in bioRxiv")
             return articles
-            
+
         except Exception as e:
             logger.error(f"Error searching bioRxiv: {e}")
             return []
-    
-    def collect_articles(self, queries: List[str], max_per_query: int = 20) -> List[Dict]:
+
+    async def collect_articles_async(self, queries: List[str],
+                                     max_per_query: int = 20) -> List[Dict]:
         """
-        Collect articles from multiple queries.
-        
+        Collect articles from multiple queries with concurrent fetches.
+
         Args:
             queries: List of search queries
             max_per_query: Maximum articles per query
-            
+
         Returns:
             List of collected articles
         """
         all_articles = []
-        
-        for query in queries:
-            logger.info(f"Processing query: {query}")
-            
-            # Search PubMed
-            pmids = self.search_pubmed(query, max_per_query)
-            
-            # Fetch details for each PMID
-            for pmid in tqdm(pmids, desc=f"PubMed articles for '{query}'"):
-                details = self.fetch_pubmed_details(pmid)
-                if details:
-                    all_articles.append(details)
-                time.sleep(0.34)  # Respect NCBI rate limits (3 requests per second)
-            
-            # Search bioRxiv
-            biorxiv_articles = self.search_biorxiv(query, max_per_query // 2)
-            all_articles.extend(biorxiv_articles)
-            
-            time.sleep(1)  # Brief pause between queries
-        
+
+        # Fresh semaphore per run: it binds to the loop that first awaits
+        # it, and each collect_articles() call starts a new loop
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._make_session() as session:
+            for query in queries:
+                logger.info(f"Processing query: {query}")
+
+                # Search PubMed
+                pmids = await self.search_pubmed(session, query, max_per_query)
+
+                # Fetch details for all PMIDs in batched efetch calls
+                all_articles.extend(
+                    await self.fetch_pubmed_details_batch(session, pmids)
+                )
+
+                # Search bioRxiv
+                biorxiv_articles = await self.search_biorxiv(session, query, max_per_query // 2)
+                all_articles.extend(biorxiv_articles)
+
+        self._flush_cache()
         logger.info(f"Total articles collected: {len(all_articles)}")
         return all_articles
-    
+
+    def collect_articles(self, queries: List[str], max_per_query: int = 20) -> List[Dict]:
+        """
+        Collect articles from multiple queries.
+
+        Args:
+            queries: List of search queries
+            max_per_query: Maximum articles per query
+
+        Returns:
+            List of collected articles
+        """
+        return asyncio.run(self.collect_articles_async(queries, max_per_query))
+
     def save_articles(self, articles: List[Dict], filename: str = "articles.json"):
         """
         Save collected articles to JSON file.
-        
+
         Args:
             articles: List of article dictionaries
             filename: Output filename
         """
         filepath = os.path.join(self.output_dir, filename)
-        
+
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(articles, f, indent=2, ensure_ascii=False)
-        
+
         logger.info(f"Articles saved to {filepath}")
 
 
 def main():
     """Main function to demonstrate article collection."""
-    
+
     # Define search queries related to Alzheimer's disease
     queries = [
         "Alzheimer's disease therapeutic targets",
@@ -254,18 +501,18 @@ def main():
         "Alzheimer's disease molecular targets",
         "Alzheimer's disease treatment targets"
     ]
-    
+
     # Initialize collector
     collector = ArticleCollector()
-    
+
     # Collect articles
     articles = collector.collect_articles(queries, max_per_query=15)
-    
+
     # Save articles
     collector.save_articles(articles, "alzheimer_articles.json")
-    
+
     print(f"Successfully collected {len(articles)} articles")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
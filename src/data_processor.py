@@ -6,7 +6,23 @@ Handles text extraction, cleaning, and chunking for RAG pipeline.
 import os
 import json
 import re
+import itertools
+from dataclasses import dataclass
+from functools import cached_property
+from multiprocessing import Pool
 import pandas as pd
+# orjson serializes 5-10x faster than stdlib json; fall back if missing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+# ijson streams large JSON arrays one object at a time; fall back if missing
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 from typing import List, Dict, Optional, Tuple
 import logging
 # Import NLTK components with fallback
@@ -58,25 +74,110 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
+def write_jsonl(records: List[Dict], filepath: str):
+    """
+    Write records as JSON Lines, one object per line.
+
+    Streams to disk instead of buffering the serialized corpus in memory,
+    and lets downstream consumers read line by line.
+
+    Args:
+        records: Dictionaries to serialize
+        filepath: Output path
+    """
+    with open(filepath, 'wb') as f:
+        for record in records:
+            if ORJSON_AVAILABLE:
+                f.write(orjson.dumps(record))
+            else:
+                f.write(json.dumps(record, ensure_ascii=False).encode('utf-8'))
+            f.write(b'\n')
+
+
+# Lightweight sentence splitter; Punkt-level accuracy is overkill for
+# abstracts and this is ~20x faster per call
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+')
+
+# Fused pattern for clean_text: HTML tags, URLs and emails in one scan
+_RE_MARKUP = re.compile(r'<[^>]+>|http[s]?://\S+|\S+@\S+')
+
+# Translation table mapping every non-alphabetic byte to a space (built once;
+# bytes.translate runs in C, far faster than a character-class re.sub)
+_KEEP_ALPHA = bytes(c if chr(c).isalpha() or chr(c) == ' ' else ord(' ')
+                    for c in range(256))
+
+# Section headings recognized by extract_sections; one finditer walk over
+# the article locates all of them in a single scan. A heading must sit on
+# its own line (optionally with a trailing colon) so the same words in
+# ordinary prose — nearly every abstract mentions "methods" and "results" —
+# do not start sections
+_SECTION_RE = re.compile(
+    r'^[ \t]*(abstract|introduction|background|methods|results|conclusion'
+    r'|discussion|references|acknowledgments)[ \t]*:?[ \t]*$',
+    re.IGNORECASE | re.MULTILINE)
+
+# A blank line terminates a section body, matching the per-section
+# patterns the single scan replaced
+_BLANK_RE = re.compile(r'\n[ \t]*\n')
+
+# Alternate heading names folded into the sections we keep
+_SECTION_ALIASES = {'background': 'introduction', 'discussion': 'conclusion'}
+
+
+@dataclass(slots=True)
+class Chunk:
+    """A processed text chunk sharing its article's metadata record.
+
+    Slots avoid the per-instance __dict__, which matters when a corpus
+    produces hundreds of thousands of chunks.
+    """
+    text: str
+    section: str
+    metadata: Dict
+
+    def to_dict(self) -> Dict:
+        """Convert to the dict shape the RAG pipeline consumes."""
+        return {'text': self.text, 'section': self.section,
+                'metadata': self.metadata}
+
+
 class TextProcessor:
     """Processes and cleans text data for RAG pipeline."""
     
-    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50):
+    def __init__(self, chunk_size: int = 500, chunk_overlap: int = 50,
+                 use_nltk: bool = False):
         """
         Initialize the text processor.
-        
+
         Args:
             chunk_size: Size of text chunks in characters
             chunk_overlap: Overlap between chunks in characters
+            use_nltk: Use NLTK's Punkt tokenizer for sentence splitting
+                instead of the fast regex splitter (more accurate on
+                full-text articles, much slower)
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        self.use_nltk = use_nltk and NLTK_AVAILABLE
+
+    @cached_property
+    def stop_words(self) -> set:
+        """English stopword set, loaded lazily on first access.
+
+        Nothing on the processing hot path reads this, and the NLTK corpus
+        load costs ~50-100 ms per process — noticeable when spawning a pool
+        of workers.
+        """
         if NLTK_AVAILABLE:
-            self.stop_words = set(stopwords.words('english'))
-        else:
-            self.stop_words = stopwords  # Use our fallback set
-        self.stemmer = PorterStemmer()
-    
+            return set(stopwords.words('english'))
+        return stopwords  # Use our fallback set
+
+    @cached_property
+    def stemmer(self) -> PorterStemmer:
+        """Stemmer instance, created lazily on first access."""
+        return PorterStemmer()
+
+
     def clean_text(self, text: str) -> str:
         """
         Clean and normalize text.
@@ -90,25 +191,15 @@ class TextProcessor:
         if not text:
             return ""
         
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove special characters and digits (keep letters and spaces)
-        text = re.sub(r'[^a-zA-Z\s]', ' ', text)
-        
+        # Lowercase, then strip HTML tags, URLs and emails in a single scan
+        text = _RE_MARKUP.sub(' ', text.lower())
+
+        # Replace everything non-alphabetic with spaces via the C-level
+        # translation table (digits, punctuation, non-ASCII)
+        text = text.encode('ascii', 'ignore').translate(_KEEP_ALPHA).decode('ascii')
+
         # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        return text
+        return ' '.join(text.split())
     
     def extract_sections(self, text: str) -> Dict[str, str]:
         """
@@ -130,104 +221,88 @@ class TextProcessor:
         if not text:
             return sections
         
-        # Convert to lowercase for pattern matching
-        text_lower = text.lower()
-        
-        # Extract abstract
-        abstract_patterns = [
-            r'abstract\s*\n(.*?)(?=\n\s*\n|\nintroduction|\nbackground|\nmethods|\nresults|\nconclusion)',
-            r'abstract\s*(.*?)(?=\n\s*\n|\nintroduction|\nbackground|\nmethods|\nresults|\nconclusion)'
-        ]
-        
-        for pattern in abstract_patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                sections['abstract'] = match.group(1).strip()
-                break
-        
-        # Extract introduction
-        intro_patterns = [
-            r'introduction\s*\n(.*?)(?=\n\s*\n|\nmethods|\nresults|\nconclusion|\ndiscussion)',
-            r'background\s*\n(.*?)(?=\n\s*\n|\nmethods|\nresults|\nconclusion|\ndiscussion)'
-        ]
-        
-        for pattern in intro_patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                sections['introduction'] = match.group(1).strip()
-                break
-        
-        # Extract conclusion
-        conclusion_patterns = [
-            r'conclusion\s*\n(.*?)(?=\n\s*\n|\nreferences|\nacknowledgments|$)',
-            r'discussion\s*\n(.*?)(?=\n\s*\n|\nreferences|\nacknowledgments|$)'
-        ]
-        
-        for pattern in conclusion_patterns:
-            match = re.search(pattern, text_lower, re.DOTALL | re.IGNORECASE)
-            if match:
-                sections['conclusion'] = match.group(1).strip()
-                break
-        
+        # One scan finds every heading (patterns are case-insensitive, so no
+        # lowercased copy of the article is needed); each section's body is
+        # the slice of the original text between consecutive matches
+        matches = list(_SECTION_RE.finditer(text))
+        seen = set()
+        for i, match in enumerate(matches):
+            heading = match.group(1).lower()
+            name = _SECTION_ALIASES.get(heading, heading)
+            # Keep only the sections we track, first occurrence wins
+            if name not in ('abstract', 'introduction', 'conclusion') or name in seen:
+                continue
+            seen.add(name)
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            body = text[match.end():end]
+            blank = _BLANK_RE.search(body)
+            if blank:
+                body = body[:blank.start()]
+            sections[name] = body.strip()
+
         return sections
     
-    def chunk_text(self, text: str, metadata: Dict = None) -> List[Dict]:
+    def chunk_text(self, text: str, metadata: Dict = None,
+                   section: str = '') -> List[Chunk]:
         """
         Split text into chunks for vector storage.
-        
+
+        The metadata dict is attached by reference, not copied, so every
+        chunk of an article shares one metadata record.
+
         Args:
             text: Text to chunk
-            metadata: Additional metadata to include with each chunk
-            
+            metadata: Article-level metadata shared by all chunks
+            section: Section name this text came from
+
         Returns:
-            List of chunk dictionaries
+            List of Chunk records
         """
         if not text:
             return []
         
-        # Use sentence tokenization for better chunking
-        sentences = sent_tokenize(text)
+        # Split into sentences; regex splitter by default, Punkt on request
+        if self.use_nltk:
+            sentences = sent_tokenize(text)
+        else:
+            sentences = _SENT_SPLIT.split(text)
         chunks = []
-        current_chunk = ""
-        current_length = 0
-        
+        # Buffer sentences in a list and join once per flush; repeated
+        # str concatenation is quadratic in the chunk length
+        buf = []
+        current_length = 0  # tracks len(" ".join(buf)) exactly
+
         for sentence in sentences:
             sentence_length = len(sentence)
-            
+            added = sentence_length + (1 if buf else 0)  # +1 joining space
+
             # If adding this sentence would exceed chunk size
-            if current_length + sentence_length > self.chunk_size:
-                if current_chunk:
-                    # Save current chunk
-                    chunk_data = {
-                        'text': current_chunk.strip(),
-                        'metadata': metadata or {}
-                    }
-                    chunks.append(chunk_data)
-                
+            if buf and current_length + added > self.chunk_size:
+                # Save current chunk
+                flushed = " ".join(buf)
+                chunks.append(Chunk(flushed.strip(), section, metadata or {}))
+
                 # Start new chunk with overlap
                 if self.chunk_overlap > 0:
-                    # Find overlap point
-                    overlap_text = current_chunk[-self.chunk_overlap:] if current_chunk else ""
-                    current_chunk = overlap_text + " " + sentence
-                    current_length = len(current_chunk)
+                    overlap_text = flushed[-self.chunk_overlap:]
+                    buf = [overlap_text, sentence]
+                    current_length = len(overlap_text) + 1 + sentence_length
                 else:
-                    current_chunk = sentence
+                    buf = [sentence]
                     current_length = sentence_length
             else:
-                current_chunk += " " + sentence
-                current_length += sentence_length
-        
+                buf.append(sentence)
+                current_length += added
+
         # Add final chunk
-        if current_chunk.strip():
-            chunk_data = {
-                'text': current_chunk.strip(),
-                'metadata': metadata or {}
-            }
-            chunks.append(chunk_data)
-        
+        if buf:
+            final = " ".join(buf).strip()
+            if final:
+                chunks.append(Chunk(final, section, metadata or {}))
+
         return chunks
     
-    def process_article(self, article: Dict) -> List[Dict]:
+    def process_article(self, article: Dict) -> List[Chunk]:
         """
         Process a single article and return chunks.
         
@@ -251,33 +326,30 @@ class TextProcessor:
             'doi': article.get('doi', '')
         }
         
-        # Process different sections
+        # Process different sections; the one metadata dict is shared by
+        # reference across every chunk instead of copied per section
         all_chunks = []
-        
+
         # Process abstract
         if sections['abstract']:
             cleaned_abstract = self.clean_text(sections['abstract'])
-            abstract_chunks = self.chunk_text(cleaned_abstract, {**metadata, 'section': 'abstract'})
-            all_chunks.extend(abstract_chunks)
-        
+            all_chunks.extend(self.chunk_text(cleaned_abstract, metadata, 'abstract'))
+
         # Process introduction
         if sections['introduction']:
             cleaned_intro = self.clean_text(sections['introduction'])
-            intro_chunks = self.chunk_text(cleaned_intro, {**metadata, 'section': 'introduction'})
-            all_chunks.extend(intro_chunks)
-        
+            all_chunks.extend(self.chunk_text(cleaned_intro, metadata, 'introduction'))
+
         # Process conclusion
         if sections['conclusion']:
             cleaned_conclusion = self.clean_text(sections['conclusion'])
-            conclusion_chunks = self.chunk_text(cleaned_conclusion, {**metadata, 'section': 'conclusion'})
-            all_chunks.extend(conclusion_chunks)
-        
+            all_chunks.extend(self.chunk_text(cleaned_conclusion, metadata, 'conclusion'))
+
         # If no sections found, process full text
         if not all_chunks and sections['full_text']:
             cleaned_full = self.clean_text(sections['full_text'])
-            full_chunks = self.chunk_text(cleaned_full, {**metadata, 'section': 'full'})
-            all_chunks.extend(full_chunks)
-        
+            all_chunks.extend(self.chunk_text(cleaned_full, metadata, 'full'))
+
         return all_chunks
 
 
@@ -296,22 +368,30 @@ class DataAnalyzer:
     
     def _create_dataframe(self) -> pd.DataFrame:
         """Create pandas DataFrame from articles."""
-        data = []
-        for article in self.articles:
-            data.append({
-                'title': article.get('title', ''),
-                'abstract': article.get('abstract', ''),
-                'authors': ', '.join(article.get('authors', [])),
-                'journal': article.get('journal', ''),
-                'pub_date': article.get('pub_date', ''),
-                'source': article.get('source', ''),
-                'pmid': article.get('pmid', ''),
-                'doi': article.get('doi', ''),
-                'abstract_length': len(article.get('abstract', '')),
-                'title_length': len(article.get('title', ''))
-            })
-        
-        return pd.DataFrame(data)
+        if not self.articles:
+            return pd.DataFrame(columns=['title', 'abstract', 'authors',
+                                         'journal', 'pub_date', 'source',
+                                         'pmid', 'doi', 'abstract_length',
+                                         'title_length'])
+
+        # Flatten once in C instead of building a list of dicts in Python
+        df = pd.json_normalize(self.articles)
+        for col in ('title', 'abstract', 'authors', 'journal', 'pub_date',
+                    'source', 'pmid', 'doi'):
+            if col not in df.columns:
+                df[col] = ''
+        df = df[['title', 'abstract', 'authors', 'journal', 'pub_date',
+                 'source', 'pmid', 'doi']].fillna('')
+
+        # Author lists arrive as Python lists; join them to strings
+        df['authors'] = df['authors'].apply(
+            lambda a: ', '.join(a) if isinstance(a, list) else a)
+
+        # Vectorized length columns
+        df['abstract_length'] = df['abstract'].str.len()
+        df['title_length'] = df['title'].str.len()
+
+        return df
     
     def basic_stats(self) -> Dict:
         """Generate basic statistics about the dataset."""
@@ -329,17 +409,11 @@ class DataAnalyzer:
     
     def _get_yearly_distribution(self) -> Dict:
         """Get article distribution by year."""
-        # Extract years from publication dates
-        years = []
-        for date in self.df['pub_date']:
-            if date and date != 'Unknown':
-                # Extract year (assuming format like "2023 Jan" or "2023")
-                year_match = re.search(r'\d{4}', str(date))
-                if year_match:
-                    years.append(year_match.group())
-        
-        year_counts = pd.Series(years).value_counts().sort_index()
-        return year_counts.to_dict()
+        # Extract years (formats like "2023 Jan" or "2023") in one C-level scan
+        years = (self.df['pub_date'].astype(str)
+                 .str.extract(r'(\d{4})', expand=False)
+                 .dropna())
+        return years.value_counts().sort_index().to_dict()
     
     def save_analysis(self, output_path: str):
         """Save analysis results to file."""
@@ -376,35 +450,59 @@ def main():
     # Load the real articles we collected
     articles_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'raw', 'alzheimer_articles.json')
     
-    if os.path.exists(articles_file):
-        with open(articles_file, 'r', encoding='utf-8') as f:
-            articles = json.load(f)
-        print(f"Loaded {len(articles)} articles from {articles_file}")
-    else:
+    if not os.path.exists(articles_file):
         print(f"Articles file not found at {articles_file}")
         return
-    
-    # Process articles
+
+    # Process articles across all cores; each article is independent, so
+    # the chunking stage parallelizes cleanly. With ijson the file is
+    # streamed one article at a time straight into the pool, so the raw
+    # corpus is never fully resident during chunking.
     processor = TextProcessor(chunk_size=500, chunk_overlap=50)
-    all_chunks = []
-    
-    for article in articles:
-        chunks = processor.process_article(article)
-        all_chunks.extend(chunks)
-    
-    print(f"Processed {len(articles)} articles into {len(all_chunks)} chunks")
-    
-    # Save processed chunks
+    with open(articles_file, 'rb') as f:
+        if IJSON_AVAILABLE:
+            articles_iter = ijson.items(f, 'item')
+        else:
+            articles_iter = json.load(f)
+        with Pool() as pool:
+            chunk_lists = list(pool.imap_unordered(processor.process_article,
+                                                   articles_iter, chunksize=32))
+    all_chunks = list(itertools.chain.from_iterable(chunk_lists))
+
+    print(f"Processed {len(chunk_lists)} articles into {len(all_chunks)} chunks")
+
+    # Save as two tables: chunk rows referencing their article's metadata
+    # record by meta_id, so the metadata fields are stored once per article
+    # instead of once per chunk
     output_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed')
     os.makedirs(output_dir, exist_ok=True)
-    output_file = os.path.join(output_dir, 'processed_chunks.json')
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(all_chunks, f, indent=2, ensure_ascii=False)
-    
+    output_file = os.path.join(output_dir, 'processed_chunks.jsonl')
+    metadata_file = os.path.join(output_dir, 'article_metadata.jsonl')
+
+    chunk_rows = []
+    metadata_records = []
+    for chunks in chunk_lists:
+        if not chunks:
+            continue
+        meta_id = len(metadata_records)
+        metadata_records.append(chunks[0].metadata)
+        for chunk in chunks:
+            chunk_rows.append({
+                'text': chunk.text,
+                'section': chunk.section,
+                'meta_id': meta_id
+            })
+
+    write_jsonl(chunk_rows, output_file)
+    write_jsonl(metadata_records, metadata_file)
+
     print(f"Processed chunks saved to {output_file}")
+    print(f"Article metadata saved to {metadata_file}")
     
-    # Analyze data
+    # Analyze data (the analyzer builds a DataFrame, so it loads the
+    # article list in full — only this stage pays that memory cost)
+    with open(articles_file, 'r', encoding='utf-8') as f:
+        articles = json.load(f)
     analyzer = DataAnalyzer(articles)
     stats = analyzer.basic_stats()
     
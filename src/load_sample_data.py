@@ -8,8 +8,38 @@ import os
 import json
 sys.path.insert(0, 'src')
 
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
 from simple_rag_pipeline import SimpleRAGPipeline
 
+
+def load_chunks(filepath):
+    """Load processed chunks from JSONL (preferred) or legacy JSON."""
+    if filepath.endswith('.jsonl'):
+        with open(filepath, 'rb') as f:
+            records = [loads(line) for line in f if line.strip()]
+
+        # New split format: chunk rows carry a meta_id into a parallel
+        # article_metadata.jsonl table; join them back for the pipeline
+        metadata_file = os.path.join(os.path.dirname(filepath),
+                                     'article_metadata.jsonl')
+        if records and 'meta_id' in records[0] and os.path.exists(metadata_file):
+            with open(metadata_file, 'rb') as f:
+                metas = [loads(line) for line in f if line.strip()]
+            records = [{
+                'text': r['text'],
+                'metadata': {**metas[r['meta_id']],
+                             'section': r.get('section', '')}
+            } for r in records]
+        return records
+    with open(filepath, 'rb') as f:
+        return loads(f.read())
+
+
 def load_real_data():
     """Load real Alzheimer's research data from processed chunks."""
     print("Loading real Alzheimer's research data...")
@@ -17,18 +47,20 @@ def load_real_data():
     # Initialize pipeline
     pipeline = SimpleRAGPipeline()
     
-    # Load the real processed data
-    processed_file = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed', 'processed_chunks.json')
-    
+    # Load the real processed data (JSONL from data_processor, or the
+    # legacy single-JSON file)
+    processed_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed')
+    processed_file = os.path.join(processed_dir, 'processed_chunks.jsonl')
+    if not os.path.exists(processed_file):
+        processed_file = os.path.join(processed_dir, 'processed_chunks.json')
+
     if os.path.exists(processed_file):
-        with open(processed_file, 'r', encoding='utf-8') as f:
-            chunks = json.load(f)
+        chunks = load_chunks(processed_file)
         print(f"Loaded {len(chunks)} processed research chunks from {processed_file}")
         
-        # Add all chunks to pipeline
-        for chunk in chunks:
-            pipeline.add_documents([chunk])
-        
+        # Add all chunks in one bulk insert
+        pipeline.add_documents(chunks)
+
         print(f"Successfully loaded {len(chunks)} research chunks into the system")
     else:
         print(f"Processed data file not found at {processed_file}")
@@ -61,9 +93,8 @@ def load_real_data():
         ]
         
         # Add sample documents to pipeline
-        for article in sample_articles:
-            pipeline.add_documents([article])
-        
+        pipeline.add_documents(sample_articles)
+
         print(f"Successfully loaded {len(sample_articles)} sample articles into the system")
     
     print("The RAG system now contains comprehensive Alzheimer's disease research data")
@@ -4,11 +4,33 @@ Provides an interactive interface for querying the RAG system.
 """
 
 import streamlit as st
+import asyncio
+import functools
+import hashlib
+import io
 import os
 import json
 import logging
-from typing import List, Dict, Optional
-from simple_rag_pipeline import SimpleRAGPipeline, QueryResult
+import pickle
+import re
+import tempfile
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+# simple_rag_pipeline transitively pulls sentence-transformers/torch;
+# importing it lazily inside initialize_pipeline keeps the first page
+# render from blocking on those
+if TYPE_CHECKING:
+    from simple_rag_pipeline import SimpleRAGPipeline, QueryResult
+
+# PDF parsing for uploads; plain-text files always work
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -22,8 +44,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS
-st.markdown("""
+# Custom CSS; built once as a constant, but emitted on every run because
+# Streamlit drops elements that are not re-rendered in the current run
+_CSS = """
 <style>
     .main-header {
         font-size: 3rem;
@@ -52,8 +75,37 @@ st.markdown("""
         color: #666;
         font-style: italic;
     }
+    .src td {
+        padding: 0.1rem 0.5rem;
+        vertical-align: top;
+    }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+def _inject_css():
+    """Render the style block for the current run."""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+# Built pipelines are pickled here so worker cold-starts skip the rebuild
+_PIPELINE_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'alz_rag')
+
+def _pipeline_cache_path() -> Optional[str]:
+    """Cache file for the current processed data, or None if no data."""
+    data_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'processed')
+    for name in ('processed_chunks.jsonl', 'processed_chunks.json'):
+        data_path = os.path.join(data_dir, name)
+        if os.path.exists(data_path):
+            # Fingerprint the first MB plus size and mtime: appending
+            # articles leaves the prefix unchanged, and a prefix-only key
+            # would keep serving the pickled pipeline without them
+            stat = os.stat(data_path)
+            digest = hashlib.sha1()
+            with open(data_path, 'rb') as f:
+                digest.update(f.read(1 << 20))
+            digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+            return os.path.join(_PIPELINE_CACHE_DIR,
+                                f"{digest.hexdigest()}.pkl")
+    return None
 
 @st.cache_resource
 def initialize_pipeline():
@@ -61,60 +113,294 @@ def initialize_pipeline():
     try:
         # Import the data loading function
         from load_sample_data import load_real_data
-        
+
+        # On-disk cache: st.cache_resource only survives within one
+        # process, so redeploys and worker restarts would otherwise
+        # re-run the whole load + index build
+        cache_path = _pipeline_cache_path()
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                logger.warning("Stale pipeline cache, rebuilding",
+                               exc_info=True)
+
         # Load the real Alzheimer's research data
         pipeline = load_real_data()
+
+        if cache_path:
+            try:
+                os.makedirs(_PIPELINE_CACHE_DIR, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    pickle.dump(pipeline, f)
+            except Exception:
+                logger.warning("Could not persist pipeline cache",
+                               exc_info=True)
         return pipeline
     except Exception as e:
         st.error(f"Error initializing pipeline: {e}")
         return None
 
+async def _run_query(pipeline: 'SimpleRAGPipeline', question: str,
+                     top_k: int) -> 'QueryResult':
+    """Run a pipeline query off the Streamlit script thread.
+
+    The pipeline is synchronous, so the single call is shipped to a worker
+    thread; when generation becomes a separate stage it can be awaited here
+    alongside retrieval with asyncio.gather.
+    """
+    return await asyncio.to_thread(pipeline.query, question, top_k)
+
+def _stream_text(text: str):
+    """Yield text word by word for st.write_stream."""
+    for match in re.finditer(r'\S+\s*', text):
+        yield match.group()
+
+# Sidebar configuration before the first form submit
+_DEFAULT_CONFIG = {
+    'model_option': "GPT-3.5 Turbo",
+    'api_key': None,
+    'chunk_strategy': 'fixed',
+    'chunk_size': 500,
+    'chunk_overlap': 50,
+    'top_k': 3,
+}
+
+# Static right-column copy, built once instead of per rerun
+_HELP_MD = """
+**How to use:**
+1. Select a model and configure settings in the sidebar
+2. Initialize the QA chain
+3. Enter your research question or select an example
+4. Click "Search and Generate Answer"
+5. Review the generated answer and sources
+
+**Tips:**
+- Be specific with your questions
+- Check the sources for more detailed information
+- The confidence score indicates answer reliability
+"""
+
+_ABOUT_MD = """
+This RAG system helps researchers find potential drug targets for Alzheimer's disease by:
+
+- **Retrieving** relevant scientific literature
+- **Generating** comprehensive answers with citations
+- **Providing** source documents for further reading
+
+Built with LangChain, HuggingFace, and Streamlit.
+"""
+
+@functools.lru_cache(maxsize=8)
+def _system_info_md(vector_store_path: str, chunk_size: int,
+                    chunk_overlap: int, total_docs: int) -> str:
+    """Build the system-info block once per distinct configuration."""
+    return (
+        f"**Vector Store Path:** `{vector_store_path}`  \n"
+        f"**Chunk Size:** {chunk_size}  \n"
+        f"**Chunk Overlap:** {chunk_overlap}  \n"
+        "**Embedding Model:** Simple keyword matching (demo)\n\n"
+        f"**Total Documents:** {total_docs}  \n"
+        f"**Total Chunks:** {total_docs}  \n"
+        f"**Average Chunk Size:** {chunk_size} chars")
+
+# Confidence CSS classes indexed by how many thresholds the score clears
+_CONF_CLASSES = ("confidence-low", "confidence-medium", "confidence-high")
+_CONF_TMPL = '<p class="{cls}">Confidence Score: {score:.2f}</p>'
+
+def _get_prefetch_pool() -> ThreadPoolExecutor:
+    """Single-worker pool for speculative retrieval, one per session."""
+    pool = st.session_state.get('_prefetch_pool')
+    if pool is None:
+        pool = ThreadPoolExecutor(max_workers=1)
+        st.session_state['_prefetch_pool'] = pool
+    return pool
+
+def _prefetch_retrieval():
+    """Start retrieval for the current question before the button click.
+
+    Fired from widget on_change callbacks (which Streamlit already
+    debounces to commit events, not keystrokes). The query lands in the
+    pipeline's exact-match cache, so the eventual button click streams
+    the answer instantly.
+    """
+    question = st.session_state.get('question_input', '')
+    if not question.strip():
+        return
+    pipeline = initialize_pipeline()
+    if pipeline is None:
+        return
+    top_k = st.session_state.get('config', _DEFAULT_CONFIG)['top_k']
+    st.session_state['_prefetch'] = (
+        question, top_k,
+        _get_prefetch_pool().submit(pipeline.query, question, top_k))
+
+def _use_example():
+    """Copy the selected example question into the input and prefetch."""
+    st.session_state['question_input'] = st.session_state.get('example_select', '')
+    _prefetch_retrieval()
+
 def get_confidence_color(confidence: float) -> str:
     """Get CSS class for confidence level."""
-    if confidence >= 0.8:
-        return "confidence-high"
-    elif confidence >= 0.6:
-        return "confidence-medium"
-    else:
-        return "confidence-low"
+    return _CONF_CLASSES[(confidence >= 0.6) + (confidence >= 0.8)]
+
+def _materialize(uploaded, threshold_mb: int = 8):
+    """Hand off an upload as (payload, is_path) without double-copying.
+
+    Files at or under the threshold stay as the in-memory bytes Streamlit
+    already holds; larger ones spill once to a named temp file and are
+    passed to the parser by path. The caller owns unlinking spilled files.
+    """
+    data = uploaded.getvalue()
+    if len(data) <= threshold_mb << 20:
+        return data, False
+    tmp = tempfile.NamedTemporaryFile(delete=False)
+    try:
+        tmp.write(data)
+    finally:
+        tmp.close()
+    return tmp.name, True
+
+# Strips WordprocessingML tags once paragraphs are split out
+_DOCX_TAG_RE = re.compile(r'<[^>]+>')
+
+def _docx_text(data: bytes) -> str:
+    """Extract paragraph text from a .docx without a Word dependency.
+
+    A .docx is a ZIP holding word/document.xml; paragraphs become lines
+    so section extraction downstream still sees some structure. Raises
+    zipfile.BadZipFile or KeyError for files that are not real .docx.
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        xml = zf.read('word/document.xml').decode('utf-8', errors='ignore')
+    paragraphs = (_DOCX_TAG_RE.sub('', p).strip()
+                  for p in xml.split('</w:p>'))
+    return '\n'.join(p for p in paragraphs if p)
+
+def _parse_and_chunk(filename: str, payload, is_path: bool, processor,
+                     strategy: str = 'fixed') -> List[Dict]:
+    """Extract text from one materialized upload and chunk it.
+
+    Runs on a worker thread: PyMuPDF releases the GIL during parsing, so
+    several uploads parse concurrently. Strategies: 'page' keeps one
+    chunk per PDF page (fewer, larger chunks, so fewer embeddings),
+    'fixed' uses the sliding window, 'semantic' splits on recognized
+    article sections before windowing and falls back to 'fixed' when no
+    sections are found.
+    """
+    path = payload if is_path else None
+    try:
+        if filename.lower().endswith('.pdf'):
+            if not PYMUPDF_AVAILABLE:
+                return []
+            doc = (fitz.open(path) if is_path
+                   else fitz.open(stream=payload, filetype='pdf'))
+            with doc:
+                pages = [page.get_text() for page in doc]
+        else:
+            if is_path:
+                with open(path, 'rb') as f:
+                    payload = f.read()
+            if filename.lower().endswith('.docx'):
+                # A .docx is a ZIP archive; decoding its bytes as UTF-8
+                # would index XML junk as article text
+                try:
+                    pages = [_docx_text(payload)]
+                except (zipfile.BadZipFile, KeyError):
+                    logger.warning(f"Skipping {filename}: not a valid .docx")
+                    return []
+            else:
+                pages = [payload.decode('utf-8', errors='ignore')]
+    finally:
+        if path is not None:
+            os.unlink(path)
+
+    metadata = {'title': filename, 'source': 'upload'}
+
+    if strategy == 'page':
+        return [{'text': processor.clean_text(page),
+                 'metadata': {**metadata, 'page': number}}
+                for number, page in enumerate(pages, 1) if page.strip()]
+
+    raw_text = "\n".join(pages)
+    if strategy == 'semantic':
+        # extract_sections always carries the whole document under
+        # 'full_text'; only non-empty named sections indicate structure,
+        # and chunking full_text as well would index everything twice
+        sections = processor.extract_sections(raw_text)
+        named = {name: body
+                 for name, body in sections.items()
+                 if name != 'full_text' and body.strip()}
+        if named:
+            chunks = []
+            for name, body in named.items():
+                chunks.extend(processor.chunk_text(
+                    processor.clean_text(body), metadata=metadata,
+                    section=name))
+            return [{'text': c.text, 'metadata': c.metadata}
+                    for c in chunks]
+
+    chunks = processor.chunk_text(processor.clean_text(raw_text),
+                                  metadata=metadata)
+    return [{'text': c.text, 'metadata': c.metadata} for c in chunks]
+
+# Source markup specialized for the fixed metadata schema; one
+# format_map fills every field in a single pass
+_SRC_TMPL = (
+    '<div class="source-box">'
+    '<h3>Source {index}</h3>'
+    '<table class="src">'
+    '<tr><td><b>Title</b></td><td>{title}</td></tr>'
+    '<tr><td><b>Journal</b></td><td>{journal}</td></tr>'
+    '<tr><td><b>Publication Date</b></td><td>{pub_date}</td></tr>'
+    '<tr><td><b>Authors</b></td><td>{authors}</td></tr>'
+    '<tr><td><b>Source</b></td><td>{source}</td></tr>'
+    '<tr><td><b>PMID</b></td><td>{pmid}</td></tr>'
+    '<tr><td><b>DOI</b></td><td>{doi}</td></tr>'
+    '<tr><td><b>Section</b></td><td>{section}</td></tr>'
+    '</table>'
+    '<details><summary>View Source Text</summary><p>{text}</p></details>'
+    '</div>')
 
+def _source_html(i: int, source: Dict) -> str:
+    """Render one source by filling the fixed-schema template."""
+    metadata = source.get('metadata', {})
+    fields = defaultdict(lambda: 'N/A', metadata)
+    fields['index'] = i
+    fields['authors'] = (', '.join(metadata['authors'])
+                         if metadata.get('authors') else 'N/A')
+    fields['source'] = metadata.get('source', 'N/A').upper()
+    fields['text'] = source.get('text', 'No text available')
+    return _SRC_TMPL.format_map(fields)
+
+@st.fragment
 def display_sources(sources: List[Dict]):
-    """Display source documents in a formatted way."""
+    """Display source documents as one memoized HTML block.
+
+    Rendering in a fragment keeps unrelated widget reruns from re-issuing
+    the source markup, and the joined HTML is cached in session state so
+    repeat renders of the same sources reuse the built string.
+    """
     if not sources:
         st.info("No sources found for this query.")
         return
-    
-    for i, source in enumerate(sources, 1):
-        with st.container():
-            st.markdown(f"### Source {i}")
-            
-            # Source metadata
-            metadata = source.get('metadata', {})
-            col1, col2, col3 = st.columns([2, 1, 1])
-            
-            with col1:
-                st.markdown(f"**Title:** {metadata.get('title', 'N/A')}")
-                st.markdown(f"**Journal:** {metadata.get('journal', 'N/A')}")
-                st.markdown(f"**Publication Date:** {metadata.get('pub_date', 'N/A')}")
-            
-            with col2:
-                st.markdown(f"**Authors:** {', '.join(metadata.get('authors', [])) if metadata.get('authors') else 'N/A'}")
-                st.markdown(f"**Source:** {metadata.get('source', 'N/A').upper()}")
-            
-            with col3:
-                st.markdown(f"**PMID:** {metadata.get('pmid', 'N/A')}")
-                st.markdown(f"**DOI:** {metadata.get('doi', 'N/A')}")
-                st.markdown(f"**Section:** {metadata.get('section', 'N/A')}")
-            
-            # Source text
-            with st.expander("View Source Text"):
-                st.markdown(source.get('text', 'No text available'))
-            
-            st.markdown("---")
+
+    key = hash(json.dumps(sources, sort_keys=True, default=str))
+    cached = st.session_state.get('_src_cache')
+    if cached is not None and cached[0] == key:
+        html = cached[1]
+    else:
+        html = "".join(_source_html(i, source)
+                       for i, source in enumerate(sources, 1))
+        st.session_state['_src_cache'] = (key, html)
+
+    st.markdown(html, unsafe_allow_html=True)
 
 def main():
     """Main Streamlit application."""
-    
+    _inject_css()
+
     # Header
     st.markdown('<div class="main-header">🧬 Alzheimer\'s Research Assistant</div>', unsafe_allow_html=True)
     st.markdown('<div class="sub-header">AI-powered RAG system for drug target discovery</div>', unsafe_allow_html=True)
@@ -129,26 +415,60 @@ def main():
     # Sidebar
     with st.sidebar:
         st.header("Configuration")
-        
-        # Model selection
-        model_option = st.selectbox(
-            "Select LLM Model",
-            ["GPT-3.5 Turbo", "GPT-4", "Local HuggingFace Model"],
-            help="Choose the language model for generating responses"
-        )
-        
-        # API Key input (if needed)
-        api_key = None
-        if model_option in ["GPT-3.5 Turbo", "GPT-4"]:
-            api_key = st.text_input("OpenAI API Key", type="password", help="Enter your OpenAI API key")
-        
-        # Chunk settings
-        chunk_size = st.slider("Chunk Size", min_value=200, max_value=1000, value=500, step=100)
-        chunk_overlap = st.slider("Chunk Overlap", min_value=0, max_value=200, value=50, step=10)
-        
-        # Number of sources
-        top_k = st.slider("Number of Sources", min_value=1, max_value=10, value=3)
-        
+
+        # One form batches all widget changes into a single rerun on
+        # Apply, instead of a full script rerun per slider move
+        with st.form("config"):
+            model_option = st.selectbox(
+                "Select LLM Model",
+                ["GPT-3.5 Turbo", "GPT-4", "Local HuggingFace Model"],
+                help="Choose the language model for generating responses"
+            )
+            api_key = st.text_input(
+                "OpenAI API Key", type="password",
+                help="Required for the OpenAI models")
+            chunk_strategy = st.radio(
+                "Chunk Strategy", ["page", "fixed", "semantic"], index=1,
+                help="page: one chunk per PDF page (size/overlap ignored); "
+                     "fixed: sliding window from the sliders; "
+                     "semantic: split on recognized article sections")
+            chunk_size = st.slider("Chunk Size", min_value=200, max_value=1000, value=500, step=100)
+            chunk_overlap = st.slider("Chunk Overlap", min_value=0, max_value=200, value=50, step=10)
+            top_k = st.slider("Number of Sources", min_value=1, max_value=10, value=3)
+
+            if st.form_submit_button("Apply"):
+                st.session_state['config'] = {
+                    'model_option': model_option,
+                    'api_key': api_key or None,
+                    'chunk_strategy': chunk_strategy,
+                    'chunk_size': chunk_size,
+                    'chunk_overlap': chunk_overlap,
+                    'top_k': top_k,
+                }
+
+        # Applied configuration (defaults until first submit)
+        config = st.session_state.get('config', _DEFAULT_CONFIG)
+        model_option = config['model_option']
+        api_key = config['api_key']
+        chunk_strategy = config['chunk_strategy']
+        chunk_size = config['chunk_size']
+        chunk_overlap = config['chunk_overlap']
+        top_k = config['top_k']
+
+        # Query cache: the pipeline answers repeated and near-duplicate
+        # questions from its exact/semantic caches; invalidate them when
+        # the retrieval configuration changes, since the semantic cache
+        # is keyed by embedding only
+        cache_config = (model_option, top_k)
+        if st.session_state.get('_cache_config') != cache_config:
+            pipeline.clear_caches()
+            st.session_state['_cache_config'] = cache_config
+
+        stats = pipeline.cache_stats()
+        st.caption(f"Query cache: {stats['hits']} hits / {stats['misses']} misses")
+        if st.button("Clear cache"):
+            pipeline.clear_caches()
+
         # Actions
         st.divider()
         
@@ -165,16 +485,45 @@ def main():
         # Upload documents
         st.divider()
         st.header("Upload Documents")
-        uploaded_files = st.file_uploader(
-            "Upload PDF/Text files", 
-            type=["pdf", "txt", "docx"], 
-            accept_multiple_files=True,
-            help="Upload research articles to add to the knowledge base"
-        )
-        
-        if st.button("Process Documents") and uploaded_files:
-            st.info("Document processing functionality would be implemented here.")
-            st.info("This would extract text, clean it, and add it to the vector store.")
+        with st.form("upload"):
+            uploaded_files = st.file_uploader(
+                "Upload PDF/Text files",
+                type=["pdf", "txt", "docx"],
+                accept_multiple_files=True,
+                help="Upload research articles to add to the knowledge base"
+            )
+            process_clicked = st.form_submit_button("Process Documents")
+
+        if process_clicked and uploaded_files:
+            from data_processor import TextProcessor
+            processor = TextProcessor(chunk_size=chunk_size,
+                                      chunk_overlap=chunk_overlap)
+
+            # Parse files concurrently, then insert and embed all chunks
+            # in one batched pass instead of per chunk
+            progress = st.progress(0.0, text="Parsing documents...")
+            all_chunks = []
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(uploaded_files))) as executor:
+                futures = [executor.submit(_parse_and_chunk, f.name,
+                                           *_materialize(f), processor,
+                                           chunk_strategy)
+                           for f in uploaded_files]
+                for done, future in enumerate(as_completed(futures), 1):
+                    all_chunks.extend(future.result())
+                    progress.progress(done / len(futures),
+                                      text=f"Parsed {done}/{len(futures)} files")
+
+            if all_chunks:
+                pipeline.add_documents(all_chunks)
+                pipeline.build_index()  # one batched embedding pass
+                progress.progress(1.0, text="Done")
+                st.success(f"Added {len(all_chunks)} chunks from "
+                           f"{len(uploaded_files)} files")
+            else:
+                st.warning("No text could be extracted from the uploads. "
+                           "PDF support requires PyMuPDF, and .docx files "
+                           "must be valid Word documents.")
     
     # Main content
     col1, col2 = st.columns([2, 1])
@@ -191,14 +540,17 @@ def main():
             "How do tau protein tangles contribute to neurodegeneration?"
         ]
         
-        selected_question = st.selectbox("Or select an example question:", [""] + example_questions)
-        
-        # User input
+        st.selectbox("Or select an example question:", [""] + example_questions,
+                     key='example_select', on_change=_use_example)
+
+        # User input; on_change starts speculative retrieval so the
+        # button click usually finds the result already computed
         user_question = st.text_area(
             "Enter your question:",
-            value=selected_question,
             height=150,
-            placeholder="Type your research question here..."
+            placeholder="Type your research question here...",
+            key='question_input',
+            on_change=_prefetch_retrieval
         )
         
         # Query button
@@ -208,19 +560,32 @@ def main():
             else:
                 with st.spinner("Searching knowledge base and generating response..."):
                     try:
-                        # Query the RAG system
-                        result = pipeline.query(user_question, top_k=top_k)
-                        
-                        # Display results
-                        st.success("Query completed successfully!")
-                        
+                        # If prefetch already ran this exact query, wait
+                        # for it; the query below then hits the
+                        # pipeline's exact-match cache
+                        prefetched = st.session_state.pop('_prefetch', None)
+                        if (prefetched is not None
+                                and prefetched[0] == user_question
+                                and prefetched[1] == top_k):
+                            prefetched[2].result()
+
+                        # Retrieval runs off the script thread; the
+                        # answer then streams word by word instead of
+                        # appearing as one block
+                        result = asyncio.run(
+                            _run_query(pipeline, user_question, top_k))
+
                         # Answer section
                         st.header("Generated Answer")
-                        st.markdown(result.answer)
+                        st.write_stream(_stream_text(result.answer))
+
+                        st.success("Query completed successfully!")
                         
                         # Confidence score
                         confidence_class = get_confidence_color(result.confidence)
-                        st.markdown(f'<p class="{confidence_class}">Confidence Score: {result.confidence:.2f}</p>', unsafe_allow_html=True)
+                        st.markdown(_CONF_TMPL.format(cls=confidence_class,
+                                                      score=result.confidence),
+                                    unsafe_allow_html=True)
                         
                         # Sources section
                         st.header("Sources")
@@ -232,54 +597,24 @@ def main():
     
     with col2:
         st.header("System Information")
-        
-        # Pipeline status
-        st.info(f"**Vector Store Path:** {pipeline.vector_store_path}")
-        st.info(f"**Chunk Size:** {chunk_size}")
-        st.info(f"**Chunk Overlap:** {chunk_overlap}")
-        st.info("**Embedding Model:** Simple keyword matching (demo)")
-        
-        # Statistics (real data)
-        st.header("Statistics")
+
+        # One memoized markdown block replaces the per-rerun st.info and
+        # st.metric calls; it only changes with config or corpus size
         total_docs = len(pipeline.documents) if hasattr(pipeline, 'documents') else 0
-        total_chunks = total_docs
-        avg_chunk_size = f"{chunk_size} chars" if chunk_size else "N/A"
-        
-        st.metric("Total Documents", total_docs, help="Number of documents in the knowledge base")
-        st.metric("Total Chunks", total_chunks, help="Number of text chunks in the vector store")
-        st.metric("Average Chunk Size", avg_chunk_size)
-        
+        st.markdown(_system_info_md(pipeline.vector_store_path,
+                                    chunk_size, chunk_overlap, total_docs))
+
         # Evaluation metrics (placeholder)
         st.header("Evaluation Metrics")
         st.info("Retrieval and generation metrics would be displayed here.")
-        
+
         # Help section
         st.header("Help")
-        st.markdown("""
-        **How to use:**
-        1. Select a model and configure settings in the sidebar
-        2. Initialize the QA chain
-        3. Enter your research question or select an example
-        4. Click "Search and Generate Answer"
-        5. Review the generated answer and sources
-        
-        **Tips:**
-        - Be specific with your questions
-        - Check the sources for more detailed information
-        - The confidence score indicates answer reliability
-        """)
-        
+        st.markdown(_HELP_MD)
+
         # About section
         st.header("About")
-        st.markdown("""
-        This RAG system helps researchers find potential drug targets for Alzheimer's disease by:
-        
-        - **Retrieving** relevant scientific literature
-        - **Generating** comprehensive answers with citations
-        - **Providing** source documents for further reading
-        
-        Built with LangChain, HuggingFace, and Streamlit.
-        """)
+        st.markdown(_ABOUT_MD)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file